@@ -1,6 +1,5 @@
-from collections.abc import Sequence, ValuesView
-
 from matplotlib.artist import Artist
+from matplotlib.transforms import Bbox
 
 
 class BlitManager:
@@ -16,22 +15,40 @@ class BlitManager:
         """
         self.canvas = canvas
         self.bg = None
+        self.bg_bbox = None
 
         # This dict can contain nested dicts, lists, etc.
         # But all non-container values must be artists.
         # We will find them recursively.
         self.artists = {}
 
+        # A flat list of the artists, which is only rebuilt after the
+        # artists are modified.
+        self._flat_artists = None
+
+        # The region the artists can draw in. This is only recomputed
+        # after the artists are modified, or the canvas is drawn/resized.
+        self._background_bbox = None
+
         # grab the background on every draw
         self.cid = canvas.mpl_connect("draw_event", self.on_draw)
+        self.resize_cid = canvas.mpl_connect("resize_event", self.on_resize)
 
     def disconnect(self):
-        self.remove_all_artists()
+        self.remove_artists()
 
         if self.cid is not None:
-            self.mpl_disconnect(self.cid)
+            self.canvas.mpl_disconnect(self.cid)
             self.cid = None
 
+        if self.resize_cid is not None:
+            self.canvas.mpl_disconnect(self.resize_cid)
+            self.resize_cid = None
+
+    def on_resize(self, event):
+        """Callback to register with 'resize_event'."""
+        self._background_bbox = None
+
     def on_draw(self, event):
         """Callback to register with 'draw_event'."""
         cv = self.canvas
@@ -47,61 +64,110 @@ class BlitManager:
             # Ignore the request, as there are currently no axes
             return
 
-        self.bg = cv.copy_from_bbox(cv.figure.bbox)
+        # The figure or axes may have moved, so recompute the region
+        self._background_bbox = None
+        self.bg_bbox = self.background_bbox()
+        self.bg = cv.copy_from_bbox(self.bg_bbox)
         self.draw_all_artists()
 
+    def background_bbox(self):
+        """The region of the canvas the animated artists can draw in"""
+        if self._background_bbox is None:
+            self._background_bbox = self._compute_background_bbox().frozen()
+
+        return self._background_bbox
+
+    def _compute_background_bbox(self):
+        fig = self.canvas.figure
+        if not fig.axes:
+            return fig.bbox
+
+        for artist in self.flat_artists:
+            if artist.axes is None or not artist.get_clip_on():
+                # This artist may draw anywhere in the figure
+                return fig.bbox
+
+        # All of the artists are clipped to their axes. Use every axes,
+        # so that this region does not change when artists are added.
+        return Bbox.union([ax.bbox for ax in fig.axes])
+
     def remove_artists(self, *path):
         # The *path is an arbitrary path into the artist dict
-        parent = None
-        d = self.artists
-        for key in path:
-            if key not in d:
-                # It already doesn't exist. Just return.
+        if not path:
+            removed = list(self.artists.values())
+            self.artists.clear()
+        else:
+            parent = self.artists
+            for key in path[:-1]:
+                parent = parent.get(key)
+                if parent is None:
+                    # It already doesn't exist. Just return.
+                    return
+
+            removed = parent.pop(path[-1], None)
+            if removed is None:
                 return
 
-            parent = d
-            d = d[key]
-
-        for artist in _recursive_yield_artists(d):
+        for artist in _recursive_yield_artists(removed):
             artist.remove()
 
-        if parent:
-            del parent[key]
-        else:
-            self.artists.clear()
+        self.artists_modified()
+
+    def artists_modified(self):
+        """Call this after adding artists to self.artists"""
+        self._flat_artists = None
+        self._background_bbox = None
+
+    @property
+    def flat_artists(self):
+        if self._flat_artists is None:
+            self._flat_artists = list(_recursive_yield_artists(self.artists))
+
+        return self._flat_artists
 
     def draw_all_artists(self):
         """Draw all of the animated artists."""
         fig = self.canvas.figure
-        for artist in _recursive_yield_artists(self.artists):
+        for artist in self.flat_artists:
             fig.draw_artist(artist)
 
     def update(self):
         """Update the screen with animated artists."""
         cv = self.canvas
-        fig = cv.figure
 
         # paranoia in case we missed the draw event,
         if self.bg is None:
             self.on_draw(None)
+        elif self.background_bbox().bounds != self.bg_bbox.bounds:
+            # The artists can now draw outside of the cached background.
+            # A full draw is needed to cache a larger background.
+            cv.draw()
         else:
             # restore the background
             cv.restore_region(self.bg)
             # draw all of the animated artists
             self.draw_all_artists()
             # update the GUI state
-            cv.blit(fig.bbox)
+            cv.blit(self.bg_bbox)
 
         # let the GUI event loop process anything it has to do
         cv.flush_events()
 
 
 def _recursive_yield_artists(artists):
-    if isinstance(artists, dict):
-        yield from _recursive_yield_artists(artists.values())
-    elif isinstance(artists, (Sequence, ValuesView)):
-        for v in artists:
-            if isinstance(v, Artist):
-                yield v
-            else:
-                yield from _recursive_yield_artists(v)
+    # Check the exact container types, which is faster than checking
+    # against the abstract base classes.
+    t = type(artists)
+    if t is dict:
+        artists = artists.values()
+    elif t is not list and t is not tuple:
+        if isinstance(artists, Artist):
+            yield artists
+        return
+
+    for v in artists:
+        t = type(v)
+        if t is dict or t is list or t is tuple:
+            yield from _recursive_yield_artists(v)
+        elif isinstance(v, Artist):
+            yield v
@@ -3,6 +3,7 @@ import os
 import copy
 import itertools
 
+from numba import njit, prange
 import numpy as np
 import psutil
 
@@ -18,6 +19,29 @@ from skimage import transform as tf
 
 from .display_plane import DisplayPlane
 
+try:
+    import cv2
+except ImportError:
+    # OpenCV is optional. We fall back to scikit-image if it is missing.
+    cv2 = None
+
+# CuPy is optional. If it is present along with a usable CUDA device,
+# warps are performed on the GPU. It is loaded by use_gpu_warps() on the
+# first warp rather than here, since probing for a device initializes
+# the CUDA runtime.
+cupy = None
+gpu_affine_transform = None
+gpu_map_coordinates = None
+_gpu_warps_checked = False
+
+# The projective transform (and OpenCV remap tables) for each detector.
+# A new InstrumentViewer is made every time the image changes, but the
+# detector geometry usually does not, so these are kept between viewers.
+_warp_cache = {}
+
+# The size of the cv2.CV_16SC2 and CV_16UC1 remap tables for each pixel
+WARP_MAPS_BYTES_PER_PIXEL = 6
+
 
 def cartesian_viewer():
     return InstrumentViewer()
@@ -90,7 +114,14 @@ class InstrumentViewer:
         img_dtype = np.float64
         dtype_size = np.dtype(img_dtype).itemsize
 
-        mem_usage = self.dpanel.rows * self.dpanel.cols * dtype_size
+        num_pixels = self.dpanel.rows * self.dpanel.cols
+        mem_usage = num_pixels * dtype_size
+        if cv2 is not None and not use_gpu_warps():
+            # At most, remap tables are cached for each detector
+            # (see warp_transform())
+            num_maps = len(self.images_dict)
+            mem_usage += num_pixels * WARP_MAPS_BYTES_PER_PIXEL * num_maps
+
         # Extra memory we probably need for other things...
         mem_extra_buffer = 1e7
         mem_usage += mem_extra_buffer
@@ -109,6 +140,10 @@ class InstrumentViewer:
                                                 self.instr.beam_vector)
         self.dpanel.name = 'dpanel'
 
+        # These are used for every detector warp, so compute them once
+        self.dpanel_col_edges = self.dpanel.col_edge_vec
+        self.dpanel_row_edges = self.dpanel.row_edge_vec
+
     @property
     def extent(self):
         # We might want to use self.dpanel.col_edge_vec and
@@ -262,10 +297,8 @@ class InstrumentViewer:
         mp = panel.map_to_plane(corners, self.dplane.rmat,
                                 self.dplane.tvec)
 
-        col_edges = self.dpanel.col_edge_vec
-        row_edges = self.dpanel.row_edge_vec
-        j_col = cellIndices(col_edges, mp[:, 0])
-        i_row = cellIndices(row_edges, mp[:, 1])
+        j_col = cellIndices(self.dpanel_col_edges, mp[:, 0])
+        i_row = cellIndices(self.dpanel_row_edges, mp[:, 1])
 
         src = np.vstack([j_col, i_row]).T
 
@@ -275,12 +308,9 @@ class InstrumentViewer:
         dst = panel.cartToPixel(corners, pixels=True)
         dst = dst[:, ::-1]
 
-        tform3 = tf.ProjectiveTransform()
-        tform3.estimate(src, dst)
-
-        res = tf.warp(img, tform3,
-                      output_shape=(self.dpanel.rows, self.dpanel.cols),
-                      preserve_range=True)
+        output_shape = (self.dpanel.rows, self.dpanel.cols)
+        tform3, maps = warp_transform(detector_id, src, dst, output_shape)
+        res = warp_image(img, tform3, output_shape, maps)
         self.warp_dict[detector_id] = res
         return res
 
@@ -289,8 +319,15 @@ class InstrumentViewer:
         return self.img
 
     def generate_image(self):
-        img = np.zeros((self.dpanel.rows, self.dpanel.cols))
-        for key in self.images_dict.keys():
+        # Start from a copy of the first warped image, rather than
+        # zero-filling a new image and adding every warped image to it.
+        keys = list(self.images_dict)
+
+        # Drop cached warps for detectors that are no longer present
+        prune_warp_cache(keys)
+
+        img = self.warp_dict[keys[0]].astype(np.float64)
+        for key in keys[1:]:
             img += self.warp_dict[key]
 
         # In case there were any nans...
@@ -360,3 +397,198 @@ class InstrumentViewer:
             with h5py.File(filename, 'w') as f:
                 for key, value in data.items():
                     f.create_dataset(key, data=value)
+
+
+def warp_transform(key, src, dst, output_shape):
+    """Get the projective transform mapping src to dst, and its remap tables
+
+    The results are cached under key, and are re-used as long as src,
+    dst, and output_shape do not change. The remap tables are None if
+    OpenCV is not available, or if warps are performed on the GPU.
+    """
+    geometry = (src.tobytes(), dst.tobytes(), tuple(output_shape))
+    cached = _warp_cache.get(key)
+    if cached is not None and cached[0] == geometry:
+        return cached[1]
+
+    tform = tf.ProjectiveTransform()
+    tform.estimate(src, dst)
+
+    m = tform.params
+    # The perspective terms vanish when the detector is parallel to the
+    # display plane. Reduce to an affine transform in that case, since it
+    # can be warped without per-pixel divisions or coordinate arrays.
+    nrows, ncols = output_shape
+    perspective = abs(m[2, 0]) * ncols + abs(m[2, 1]) * nrows
+    affine = perspective <= 1e-10 * abs(m[2, 2])
+    if affine:
+        m = m / m[2, 2]
+        m[2] = (0, 0, 1)
+        tform = tf.AffineTransform(matrix=m)
+
+    maps = None
+    if cv2 is not None and not use_gpu_warps() and not affine:
+        # Map every output pixel to its input pixel coordinates.
+        # Affine transforms use cv2.warpAffine() instead, which is faster
+        # than a remap and needs no tables.
+        x = np.arange(output_shape[1], dtype=np.float64)
+        y = np.arange(output_shape[0], dtype=np.float64)[:, np.newaxis]
+        w = m[2, 0] * x + m[2, 1] * y + m[2, 2]
+        map_x = ((m[0, 0] * x + m[0, 1] * y + m[0, 2]) / w).astype(np.float32)
+        map_y = ((m[1, 0] * x + m[1, 1] * y + m[1, 2]) / w).astype(np.float32)
+
+        # Fixed-point maps are the fastest path for cv2.remap()
+        maps = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+    _warp_cache[key] = (geometry, (tform, maps))
+    return tform, maps
+
+
+def use_gpu_warps():
+    """Whether warps are performed on the GPU
+
+    CuPy is imported, and the CUDA devices are probed, on the first call.
+    The result is kept for the rest of the session.
+    """
+    global cupy, gpu_affine_transform, gpu_map_coordinates
+    global _gpu_warps_checked
+    if _gpu_warps_checked:
+        return cupy is not None
+
+    _gpu_warps_checked = True
+    try:
+        import cupy as cp
+        from cupyx.scipy.ndimage import affine_transform, map_coordinates
+
+        # Only use the GPU if there is a usable CUDA device
+        if cp.cuda.runtime.getDeviceCount() < 1:
+            return False
+    except Exception:
+        # Either CuPy is missing, or CUDA is not usable
+        return False
+
+    cupy = cp
+    gpu_affine_transform = affine_transform
+    gpu_map_coordinates = map_coordinates
+    return True
+
+
+def disable_gpu_warps():
+    global cupy
+    cupy = None
+
+    # The cached warps were made without remap tables for the GPU
+    _warp_cache.clear()
+
+
+def prune_warp_cache(keys):
+    """Remove cached warps for any detectors not in keys"""
+    for key in list(_warp_cache):
+        if key not in keys:
+            del _warp_cache[key]
+
+
+def warp_image(img, tform, output_shape, maps=None):
+    """Warp img into an image of shape output_shape
+
+    tform maps output pixel coordinates to input pixel coordinates, as
+    with skimage.transform.warp(). If CuPy and a CUDA device are
+    available, the warp is performed on the GPU, falling back to the CPU
+    if that fails. Next, OpenCV is used when it is available, since its
+    warp kernels are much faster than scikit-image's. Otherwise,
+    a numba kernel with the same results as skimage.transform.warp() with
+    bilinear interpolation is used. If maps from warp_transform() are
+    provided, they are used via cv2.remap().
+    """
+    affine = isinstance(tform, tf.AffineTransform)
+    if use_gpu_warps():
+        try:
+            if affine:
+                return _warp_affine_gpu(img, tform.params, output_shape)
+
+            return _warp_projective_gpu(img, tform.params, output_shape)
+        except Exception as e:
+            print('Warning: GPU warp failed. Falling back to the CPU.\n',
+                  e)
+            disable_gpu_warps()
+
+    if cv2 is None:
+        img = np.ascontiguousarray(img, dtype=np.float64)
+        out = np.empty(output_shape, dtype=np.float64)
+        _warp_projective(img, tform.params, affine, out)
+        return out
+
+    img = np.ascontiguousarray(img, dtype=np.float32)
+    if maps is not None:
+        return cv2.remap(img, *maps, cv2.INTER_LINEAR,
+                         borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+
+    # OpenCV wants (width, height) for the size
+    dsize = (output_shape[1], output_shape[0])
+    # The matrix already maps output to input, so it is the inverse map
+    flags = cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP
+    if affine:
+        return cv2.warpAffine(img, tform.params[:2], dsize, flags=flags,
+                              borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+
+    return cv2.warpPerspective(img, tform.params, dsize, flags=flags,
+                               borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _warp_projective(img, matrix, affine, out):
+    # Bilinear interpolation of img at the points that matrix maps the
+    # pixels of out to. Neighbors outside of img are treated as zero.
+    # If affine is True, the matrix's last row must be (0, 0, 1).
+    rows, cols = img.shape
+    for i in prange(out.shape[0]):
+        for j in range(out.shape[1]):
+            if affine:
+                w = 1.0
+            else:
+                w = matrix[2, 0] * j + matrix[2, 1] * i + matrix[2, 2]
+            x = (matrix[0, 0] * j + matrix[0, 1] * i + matrix[0, 2]) / w
+            y = (matrix[1, 0] * j + matrix[1, 1] * i + matrix[1, 2]) / w
+
+            x0 = int(np.floor(x))
+            y0 = int(np.floor(y))
+            dx = x - x0
+            dy = y - y0
+
+            value = 0.0
+            for r, wr in ((y0, 1 - dy), (y0 + 1, dy)):
+                if r < 0 or r >= rows:
+                    continue
+                for c, wc in ((x0, 1 - dx), (x0 + 1, dx)):
+                    if c < 0 or c >= cols:
+                        continue
+                    value += wr * wc * img[r, c]
+
+            out[i, j] = value
+
+
+def _warp_projective_gpu(img, matrix, output_shape):
+    # Same as _warp_projective(), but performed on the GPU via CuPy
+    m = matrix
+    y, x = cupy.indices(output_shape, dtype=cupy.float64)
+    w = m[2, 0] * x + m[2, 1] * y + m[2, 2]
+    coords = cupy.stack((
+        (m[1, 0] * x + m[1, 1] * y + m[1, 2]) / w,
+        (m[0, 0] * x + m[0, 1] * y + m[0, 2]) / w,
+    ))
+    img = cupy.asarray(img, dtype=cupy.float64)
+    out = gpu_map_coordinates(img, coords, order=1, mode='grid-constant',
+                              cval=0)
+    return out.get()
+
+
+def _warp_affine_gpu(img, matrix, output_shape):
+    # Same as _warp_projective_gpu(), but for affine matrices, which do
+    # not need a coordinate array. The matrix is in (x, y) order, and
+    # affine_transform() wants (row, col) order, so swap them.
+    m = matrix[[1, 0, 2]][:, [1, 0, 2]]
+    img = cupy.asarray(img, dtype=cupy.float64)
+    out = gpu_affine_transform(img, cupy.asarray(m),
+                               output_shape=output_shape, order=1,
+                               mode='grid-constant', cval=0)
+    return out.get()
@@ -49,8 +49,9 @@ class HEDMCalibrationRunner(QObject):
         self.pre_validate()
 
         # Create the grains table
-        if self.num_active_overlays > 0:
-            material = self.material
+        overlays = self.active_overlays
+        if overlays:
+            material = overlays[0].material
         else:
             material = HexrdConfig().active_material
 
@@ -66,10 +67,11 @@ class HEDMCalibrationRunner(QObject):
     def on_options_dialog_accepted(self):
         dialog = self.options_dialog
 
-        shape = (self.num_active_overlays, 21)
+        overlays = self.active_overlays
+        shape = (len(overlays), 21)
         self.grains_table = np.empty(shape, dtype=np.float64)
         gw = instrument.GrainDataWriter(array=self.grains_table)
-        for i, overlay in enumerate(self.active_overlays):
+        for i, overlay in enumerate(overlays):
             gw.dump_grain(i, 1, 0, overlay.crystal_params)
 
         self.synchronize_omega_period()
@@ -208,33 +210,28 @@ class HEDMCalibrationRunner(QObject):
 
         # define difference vectors for spot fits
         for det_key, panel in instr.detectors.items():
+            x_tol = n_pixels_tol*panel.pixel_size_col
+            y_tol = n_pixels_tol*panel.pixel_size_row
             for ig in range(ngrains):
-                x_diff = abs(xyo_det[det_key][ig][:, 0] -
-                             xyo_f[det_key][ig][:, 0])
-                y_diff = abs(xyo_det[det_key][ig][:, 1] -
-                             xyo_f[det_key][ig][:, 1])
-                ome_diff = np.degrees(
-                    xfcapi.angularDifference(
-                        xyo_det[det_key][ig][:, 2],
-                        xyo_f[det_key][ig][:, 2])
-                )
+                meas = xyo_det[det_key][ig]
+                pred = xyo_f[det_key][ig]
 
                 # filter out reflections with centroids more than
                 # a pixel and delta omega away from predicted value
-                idx_1 = np.logical_and(
-                    x_diff <= n_pixels_tol*panel.pixel_size_col,
-                    np.logical_and(
-                        y_diff <= n_pixels_tol*panel.pixel_size_row,
-                        ome_diff <= ome_tol
-                    )
+                idx_1 = (
+                    (np.abs(meas[:, 0] - pred[:, 0]) <= x_tol) &
+                    (np.abs(meas[:, 1] - pred[:, 1]) <= y_tol) &
+                    (np.degrees(xfcapi.angularDifference(
+                        meas[:, 2], pred[:, 2])) <= ome_tol)
                 )
 
                 print("INFO: Will keep %d of %d input reflections "
                       % (sum(idx_1), sum(idx_0[det_key][ig]))
                       + "on panel %s for re-fit" % det_key)
 
-                idx_new = np.zeros_like(idx_0[det_key][ig], dtype=bool)
-                idx_new[np.where(idx_0[det_key][ig])[0][idx_1]] = True
+                # Keep only the previously kept reflections that passed
+                idx_new = idx_0[det_key][ig].copy()
+                idx_new[idx_new] = idx_1
                 idx_0[det_key][ig] = idx_new
 
         # reparse data
@@ -280,10 +277,13 @@ class HEDMCalibrationRunner(QObject):
         instr = cfg.instrument.hedm
         imsd = cfg.image_series
 
+        overlays = self.active_overlays
+        plane_data = overlays[0].material.planeData if overlays else None
+
         outputs = {}
-        for i, overlay in enumerate(self.active_overlays):
+        for i, overlay in enumerate(overlays):
             kwargs = {
-                'plane_data': self.material.planeData,
+                'plane_data': plane_data,
                 'grain_params': overlay.crystal_params,
                 'tth_tol': np.degrees(overlay.tth_width),
                 'eta_tol': np.degrees(overlay.eta_width),
@@ -313,6 +313,7 @@ class HEDMCalibrationRunner(QObject):
     def write_results_message(self):
         msg = ''
 
+        overlays = self.active_overlays
         pnames = calibration.generate_parameter_names(self.instr,
                                                       self.grain_parameters)
 
@@ -331,7 +332,7 @@ class HEDMCalibrationRunner(QObject):
 
         # Next, the overlay parameters
         pname_start_ind = len(instr_flags)
-        for results, overlay in zip(self.results, self.active_overlays):
+        for results, overlay in zip(self.results, overlays):
             name = overlay.name
             refinements = overlay.refinements
             if any(refinements):
@@ -361,8 +362,11 @@ class HEDMCalibrationRunner(QObject):
         msg_box = MessageBox(**kwargs)
         msg_box.exec()
 
+        overlays = self.active_overlays
+        material = overlays[0].material
+
         # Update rotation series parameters from the results
-        for results, overlay in zip(self.results, self.active_overlays):
+        for results, overlay in zip(self.results, overlays):
             overlay.crystal_params[:] = results
 
         # Update modified instrument parameters
@@ -385,10 +389,10 @@ class HEDMCalibrationRunner(QObject):
         HexrdConfig().set_statuses_from_prev_iconfig(prev_iconfig)
 
         # Tell GUI that the overlays need to be re-computed
-        HexrdConfig().flag_overlay_updates_for_material(self.material.name)
+        HexrdConfig().flag_overlay_updates_for_material(material.name)
 
         # update the materials panel
-        if self.material is HexrdConfig().active_material:
+        if material is HexrdConfig().active_material:
             HexrdConfig().active_material_modified.emit()
 
         # Update the overlay editor in case it is visible
@@ -473,12 +477,13 @@ class HEDMCalibrationRunner(QObject):
 
     def pre_validate(self):
         # Validation to perform before we do anything else
-        if not self.active_overlays:
+        overlays = self.active_overlays
+        if not overlays:
             # No more validation needed.
             return
 
         ome_periods = []
-        for overlay in self.active_overlays:
+        for overlay in overlays:
             if not overlay.has_widths:
                 msg = (
                     'All visible rotation series overlays must have widths '
@@ -496,7 +501,7 @@ class HEDMCalibrationRunner(QObject):
                 )
                 raise Exception(msg)
 
-        materials = [overlay.material_name for overlay in self.active_overlays]
+        materials = [overlay.material_name for overlay in overlays]
         if not all(x == materials[0] for x in materials):
             msg = (
                 'All visible rotation series overlays must have the same '
@@ -529,21 +534,37 @@ def parse_spots_data(spots_data, instr, grain_ids, refit_idx=None):
 
         for ig, grain_id in enumerate(grain_ids):
             data = spots_data[grain_id][1][det_key]
-            # Convert to numpy array to make operations easier
-            data = np.array(data, dtype=object)
-            valid_reflections = data[:, 0] >= 0
-            not_saturated = data[:, 4] < panel.saturation_level
+
+            # Each row is (peak_id, hkl_id, hkl, sum_int, max_int,
+            # pred_angs, meas_angs, meas_xy). Only the scalar columns are
+            # needed for the mask, so read just those into typed arrays.
+            num_rows = len(data)
+            peak_ids = np.fromiter((x[0] for x in data), dtype=int,
+                                   count=num_rows)
+            max_ints = np.fromiter((x[4] for x in data), dtype=np.float64,
+                                   count=num_rows)
+
+            valid_reflections = peak_ids >= 0
+            not_saturated = max_ints < panel.saturation_level
 
             if refit_idx is None:
-                idx = np.logical_and(valid_reflections, not_saturated)
+                idx = valid_reflections & not_saturated
                 idx_0[det_key].append(idx)
             else:
                 idx = refit_idx[det_key][ig]
                 idx_0[det_key].append(idx)
 
-            hkls[det_key].append(np.vstack(data[idx, 2]))
-            meas_omes = np.vstack(data[idx, 6])[:, 2].reshape(sum(idx), 1)
-            xyo_det[det_key].append(np.hstack([np.vstack(data[idx, 7]),
-                                               meas_omes]))
+            # Now unpack the vector columns of the kept rows only
+            kept = [data[i] for i in np.flatnonzero(idx)]
+            num_kept = len(kept)
+            det_hkls = np.empty((num_kept, 3), dtype=np.int32)
+            det_xyo = np.empty((num_kept, 3), dtype=np.float64)
+            for i, row in enumerate(kept):
+                det_hkls[i] = row[2]
+                det_xyo[i, :2] = row[7]
+                det_xyo[i, 2] = row[6][2]
+
+            hkls[det_key].append(det_hkls)
+            xyo_det[det_key].append(det_xyo)
 
     return hkls, xyo_det, idx_0
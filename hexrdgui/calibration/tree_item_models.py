@@ -18,6 +18,9 @@ def _tree_columns_to_indices(columns):
 class CalibrationTreeItemModel(MultiColumnDictTreeItemModel):
     """Subclass the tree item model so we can customize some behavior"""
 
+    # Parameters that hit their bounds are colored red
+    BOUND_HIT_COLOR = QColor(255, 0, 0)
+
     def set_config_val(self, path, value):
         super().set_config_val(path, value)
         # Now set the parameter too
@@ -67,24 +70,29 @@ class DefaultCalibrationTreeItemModel(CalibrationTreeItemModel):
     MAX_IDX = COLUMN_INDICES['Maximum']
     MIN_IDX = COLUMN_INDICES['Minimum']
     BOUND_INDICES = (VALUE_IDX, MAX_IDX, MIN_IDX)
+    BOUND_PAIRS = (
+        (VALUE_IDX, MAX_IDX),
+        (VALUE_IDX, MIN_IDX),
+    )
 
     def data(self, index, role):
-        if role == Qt.ForegroundRole and index.column() in self.BOUND_INDICES:
+        if role != Qt.ForegroundRole:
+            return super().data(index, role)
+
+        column = index.column()
+        if column in self.BOUND_INDICES:
             # If a value hit the boundary, color both the boundary and the
             # value red.
             item = self.get_item(index)
-            if not item.child_items and item.data(self.VALUE_IDX) is not None:
+            value = item.data(self.VALUE_IDX)
+            if not item.child_items and value is not None:
                 atol = 1e-3
-                pairs = [
-                    (self.VALUE_IDX, self.MAX_IDX),
-                    (self.VALUE_IDX, self.MIN_IDX),
-                ]
-                for pair in pairs:
-                    if index.column() not in pair:
+                for value_idx, bound_idx in self.BOUND_PAIRS:
+                    if column != value_idx and column != bound_idx:
                         continue
 
-                    if abs(item.data(pair[0]) - item.data(pair[1])) < atol:
-                        return QColor('red')
+                    if abs(value - item.data(bound_idx)) < atol:
+                        return self.BOUND_HIT_COLOR
 
         return super().data(index, role)
 
@@ -109,6 +117,6 @@ class DeltaCalibrationTreeItemModel(CalibrationTreeItemModel):
             if not item.child_items and item.data(self.VALUE_IDX) is not None:
                 atol = 1e-3
                 if abs(item.data(self.DELTA_IDX)) < atol:
-                    return QColor('red')
+                    return self.BOUND_HIT_COLOR
 
         return super().data(index, role)
@@ -195,8 +195,10 @@ class ColorMapEditor:
         elif not isinstance(data, (list, tuple)):
             values = [data]
 
-        l = min([np.nanpercentile(v, low) for v in values])
-        h = min([np.nanpercentile(v, high) for v in values])
+        # Compute both percentiles in a single pass over each image
+        percentiles = [np.nanpercentile(v, (low, high)) for v in values]
+        l = min(x[0] for x in percentiles)
+        h = min(x[1] for x in percentiles)
 
         if h - l < 5:
             h = l + 5
@@ -83,30 +83,47 @@ def widget_from_description(x, parent=None):
     return widget
 
 
+def _widget_function(functions, w):
+    # Look up the exact type first, then fall back to its base classes
+    for t in type(w).__mro__:
+        if t in functions:
+            return functions[t]
+
+    raise NotImplementedError(f'Type of widget not implemented: {type(w)}')
+
+
 def widget_value(w):
     if not w:
         return
-    elif isinstance(w, (QSpinBox, QDoubleSpinBox)):
-        return w.value()
-    elif isinstance(w, QCheckBox):
-        return w.isChecked()
-    else:
-        raise NotImplementedError(f'Type of widget not implemented: {type(w)}')
+
+    return _widget_function(_VALUE_GETTERS, w)(w)
 
 
 def set_widget_value(w, v):
-    if isinstance(w, (QSpinBox, QDoubleSpinBox)):
-        w.setValue(v)
-    elif isinstance(w, QCheckBox):
-        w.setChecked(v)
-    else:
-        raise NotImplementedError(f'Type of widget not implemented: {type(w)}')
+    _widget_function(_VALUE_SETTERS, w)(w, v)
 
 
 def value_changed_signal(w):
-    if isinstance(w, (QSpinBox, QDoubleSpinBox)):
-        return w.valueChanged
-    elif isinstance(w, QCheckBox):
-        return w.toggled
-    else:
-        raise NotImplementedError(f'Type of widget not implemented: {type(w)}')
+    return _widget_function(_VALUE_CHANGED_SIGNALS, w)(w)
+
+
+_VALUE_GETTERS = {
+    QSpinBox: lambda w: w.value(),
+    QDoubleSpinBox: lambda w: w.value(),
+    ScientificDoubleSpinBox: lambda w: w.value(),
+    QCheckBox: lambda w: w.isChecked(),
+}
+
+_VALUE_SETTERS = {
+    QSpinBox: lambda w, v: w.setValue(v),
+    QDoubleSpinBox: lambda w, v: w.setValue(v),
+    ScientificDoubleSpinBox: lambda w, v: w.setValue(v),
+    QCheckBox: lambda w, v: w.setChecked(v),
+}
+
+_VALUE_CHANGED_SIGNALS = {
+    QSpinBox: lambda w: w.valueChanged,
+    QDoubleSpinBox: lambda w: w.valueChanged,
+    ScientificDoubleSpinBox: lambda w: w.valueChanged,
+    QCheckBox: lambda w: w.toggled,
+}
@@ -1,4 +1,5 @@
 import copy
+import functools
 import logging
 import os
 from pathlib import Path
@@ -1778,10 +1779,8 @@ class HexrdConfig(QObject, metaclass=QSingleton):
 
     @property
     def available_default_materials(self):
-        module = hexrdgui.resources.materials
-        with resource_loader.path(module, 'materials.h5') as file_path:
-            with h5py.File(file_path) as f:
-                return list(f.keys())
+        # Return a copy so the cached list cannot be modified
+        return list(_default_material_names())
 
     # This section is for materials configuration
     def load_default_material(self, name):
@@ -3145,3 +3144,13 @@ class HexrdConfig(QObject, metaclass=QSingleton):
         self._set_detector_coatings('phosphor')
         phosphor = self._detector_coatings[det_name]['phosphor']
         phosphor.deserialize(**kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_material_names():
+    # The default materials file is a static resource, so only read
+    # the material names from it once.
+    module = hexrdgui.resources.materials
+    with resource_loader.path(module, 'materials.h5') as file_path:
+        with h5py.File(file_path) as f:
+            return tuple(f.keys())
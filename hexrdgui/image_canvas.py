@@ -384,6 +384,8 @@ class ImageCanvas(FigureCanvas):
         if self.mode == ViewType.polar and overlay.type == OverlayType.powder:
             self.draw_azimuthal_powder_lines(overlay)
 
+        self.blit_manager.artists_modified()
+
     def draw_powder_overlay(self, artist_key, det_key, axis, data, style,
                             highlight_style):
         rings = data['rings']
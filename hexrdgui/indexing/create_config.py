@@ -9,6 +9,7 @@ from hexrd.config.instrument import Instrument as InstrumentConfig
 
 from hexrdgui.create_hedm_instrument import create_hedm_instrument
 from hexrdgui.hexrd_config import HexrdConfig
+from hexrdgui.utils import copy_config
 
 
 def get_indexing_material():
@@ -28,7 +29,7 @@ def create_indexing_config():
     material = get_indexing_material()
 
     # Make a copy to modify
-    indexing_config = copy.deepcopy(HexrdConfig().indexing_config)
+    indexing_config = copy_config(HexrdConfig().indexing_config)
 
     if HexrdConfig().max_cpus is not None:
         # Set the max number of CPUs
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 
+import numpy as np
+
 
 class FitGrainsToleranceModel(QAbstractTableModel):
     """Model for grain-fitting tolerances
@@ -9,11 +11,21 @@ class FitGrainsToleranceModel(QAbstractTableModel):
 
     data_modified = Signal()
 
+    HEADERS = ('tth', 'eta', 'omega')
+
+    # Every item has the same flags. These are the QAbstractTableModel
+    # defaults for valid indices, plus editable.
+    ITEM_FLAGS = (Qt.ItemIsSelectable | Qt.ItemIsEnabled |
+                  Qt.ItemNeverHasChildren | Qt.ItemIsEditable)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.tth_tolerances = []
-        self.eta_tolerances = []
-        self.omega_tolerances = []
+        # One row per tolerance set, with columns (tth, eta, omega)
+        self.tolerances = np.zeros((0, 3), dtype=np.float64)
+
+        # The cached columns. Every method that modifies the tolerances
+        # must invalidate this.
+        self._data_columns = None
 
     # Override methods:
 
@@ -25,14 +37,13 @@ class FitGrainsToleranceModel(QAbstractTableModel):
             return
 
         row, column = model_index.row(), model_index.column()
-        if row < 0 or row >= len(self.tth_tolerances):
+        if row < 0 or row >= self.tolerances.shape[0]:
             return
 
-        if column < 0 or column >= len(self.data_columns):
+        if column < 0 or column >= self.tolerances.shape[1]:
             return
 
-        # Note that conventional [row][col] is reversed here
-        return self.data_columns[column][row]
+        return float(self.tolerances[row, column])
 
     def setData(self, model_index, value, role=Qt.EditRole):
         # This should always be a float
@@ -42,44 +53,47 @@ class FitGrainsToleranceModel(QAbstractTableModel):
             return False
 
         row, column = model_index.row(), model_index.column()
-        # Note that conventional [row][col] is reversed here
-        self.data_columns[column][row] = value
+        self.tolerances[row, column] = value
+        self._invalidate_data_columns()
 
         self.data_modified.emit()
         return True
 
     def flags(self, model_index):
+        if not model_index.isValid():
+            return super().flags(model_index)
+
         # All items are editable
-        return super().flags(model_index) | Qt.ItemIsEditable
+        return self.ITEM_FLAGS
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
-            headers = ['tth', 'eta', 'omega']
-            return headers[section]
+            return self.HEADERS[section]
         # (else)
         return super().headerData(section, orientation, role)
 
     def rowCount(self, parent=QModelIndex()):
         if parent.isValid():
             return 0
-        return len(self.tth_tolerances)
+        return self.tolerances.shape[0]
 
     # Custom methods:
 
     @property
     def data_columns(self):
-        return (
-            self.tth_tolerances,
-            self.eta_tolerances,
-            self.omega_tolerances,
-        )
+        # The (tth, eta, omega) columns as lists
+        if self._data_columns is None:
+            self._data_columns = tuple(self.tolerances.T.tolist())
+        return self._data_columns
+
+    def _invalidate_data_columns(self):
+        self._data_columns = None
 
     def add_row(self):
         new_row = self.rowCount()
         self.beginInsertRows(QModelIndex(), new_row, new_row)
-        self.tth_tolerances.append(0.0)
-        self.eta_tolerances.append(0.0)
-        self.omega_tolerances.append(0.0)
+        self.tolerances = np.vstack((self.tolerances, np.zeros(3)))
+        self._invalidate_data_columns()
         self.endInsertRows()
         self.data_modified.emit()
 
@@ -87,10 +101,9 @@ class FitGrainsToleranceModel(QAbstractTableModel):
         first = rows[0]
         last = rows[-1]
         self.beginRemoveRows(QModelIndex(), first, last)
-        for row in range(last, first-1, -1):
-            del self.tth_tolerances[row]
-            del self.eta_tolerances[row]
-            del self.omega_tolerances[row]
+        self.tolerances = np.delete(self.tolerances, np.s_[first:last+1],
+                                    axis=0)
+        self._invalidate_data_columns()
         self.endRemoveRows()
         self.data_modified.emit()
 
@@ -106,31 +119,41 @@ class FitGrainsToleranceModel(QAbstractTableModel):
         offset = 1 if delta > 0 else 0
         self.beginMoveRows(QModelIndex(), first, last,
                            QModelIndex(), destination + offset)
-        for data in self.data_columns:
-            moving_section = data[first:last+1]
-            remaining_list = data[:first] + data[last+1:]
-            first_section = remaining_list[:destination]
-            last_section = remaining_list[destination:]
-            data[:] = first_section + moving_section + last_section
+        # Moving the rows is a rotation of the span of rows they pass over
+        start = min(first, destination)
+        stop = max(last, last + delta) + 1
+        span = self.tolerances[start:stop]
+        span[:] = np.roll(span, delta, axis=0)
+        self._invalidate_data_columns()
         self.endMoveRows()
         self.data_modified.emit()
 
     def copy_to_config(self, config):
+        tth, eta, omega = self.data_columns
+        # Copy so that the config does not share the cached lists
         config['tolerance'] = {
-            'tth': self.tth_tolerances,
-            'eta': self.eta_tolerances,
-            'omega': self.omega_tolerances,
+            'tth': tth.copy(),
+            'eta': eta.copy(),
+            'omega': omega.copy(),
         }
 
     def update_from_config(self, config):
         # This method should generally be called *before* the instance
         # is assigned to a view, but just in case, we emit the internal
         # signals to notify views.
+        columns = [config.get(x) for x in self.HEADERS]
+        lengths = [len(x) for x in columns]
+        if any(x != lengths[0] for x in lengths):
+            msg = (
+                'The tth, eta, and omega tolerance lists must all have the '
+                f'same length, but their lengths are {lengths}'
+            )
+            raise Exception(msg)
+
         self.beginResetModel()
 
-        self.tth_tolerances = config.get('tth')
-        self.eta_tolerances = config.get('eta')
-        self.omega_tolerances = config.get('omega')
+        self.tolerances = np.array(columns, dtype=np.float64).T.copy()
+        self._invalidate_data_columns()
 
         self.endResetModel()
 
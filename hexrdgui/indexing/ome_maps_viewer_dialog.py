@@ -1,5 +1,6 @@
 import copy
 from pathlib import Path
+from types import SimpleNamespace
 
 from matplotlib.backends.backend_qtagg import FigureCanvas
 from matplotlib.figure import Figure
@@ -26,7 +27,7 @@ from hexrdgui.hexrd_config import HexrdConfig
 from hexrdgui.navigation_toolbar import NavigationToolbar
 from hexrdgui.select_items_widget import SelectItemsWidget
 from hexrdgui.ui_loader import UiLoader
-from hexrdgui.utils import block_signals
+from hexrdgui.utils import block_signals, copy_config
 from hexrdgui.utils.dialog import add_help_url
 
 import hexrdgui.constants
@@ -41,6 +42,11 @@ class OmeMapsViewerDialog(QObject):
     accepted = Signal()
     rejected = Signal()
 
+    # The widget config maps are static, so they are shared between all
+    # instances. These get loaded the first time they are needed.
+    _gui_config_maps = None
+    _widget_paths = None
+
     def __init__(self, data, parent=None):
         super().__init__(parent)
 
@@ -50,6 +56,18 @@ class OmeMapsViewerDialog(QObject):
         url = 'hedm/indexing/#find-orientations'
         add_help_url(self.ui.button_box, url)
 
+        # Filtering all of the maps is expensive, so wait until the filter
+        # widgets stop changing before applying the filter.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(50)
+        self.filter_timer.timeout.connect(self.filter_modified)
+
+        # A fake config to pass to hexrd when filtering the maps
+        self._filter_cfg = SimpleNamespace(
+            find_orientations=SimpleNamespace(
+                orientation_maps=SimpleNamespace(filter_maps=False)))
+
         self.data = data
         self.cmap = HexrdConfig().default_cmap
         self.norm = None
@@ -114,7 +132,7 @@ class OmeMapsViewerDialog(QObject):
                 raise Exception(f'Unhandled widget type: {type(w)}')
 
         for w in self.filter_widgets:
-            changed_signal(w).connect(self.filter_modified)
+            changed_signal(w).connect(self.filter_widget_changed)
 
         for w in self.yaml_widgets:
             changed_signal(w).connect(self.update_config)
@@ -183,7 +201,7 @@ class OmeMapsViewerDialog(QObject):
         self.ui.filtering_fwhm_label.setEnabled(fwhm_enabled)
 
     def reset_internal_config(self):
-        self.config = copy.deepcopy(HexrdConfig().indexing_config)
+        self.config = copy_config(HexrdConfig().indexing_config)
 
     def show(self):
         self.update_plot()
@@ -246,32 +264,51 @@ class OmeMapsViewerDialog(QObject):
             msg = f'Unhandled quaternion method: {self.quaternion_method_name}'
             raise ValidationException(msg)
 
-    def setup_widget_paths(self):
+    @classmethod
+    def load_gui_config_maps(cls):
+        if cls._gui_config_maps is not None:
+            return
+
         text = resource_loader.load_resource(hexrdgui.resources.indexing,
                                              'gui_config_maps.yml')
-        self.gui_config_maps = yaml.load(text, Loader=yaml.FullLoader)
+        # The C loader is much faster, if it is available
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        gui_config_maps = yaml.load(text, Loader=loader)
 
+        # Map each widget name to its path (a tuple of keys) in the config
         paths = {}
-
-        def recursive_get_paths(cur_config, cur_path):
+        stack = [(gui_config_maps, ())]
+        while stack:
+            cur_config, cur_path = stack.pop()
             for key, value in cur_config.items():
-                new_path = cur_path + [key]
+                new_path = cur_path + (key,)
                 if isinstance(value, str):
                     paths[value] = new_path
-                    continue
+                else:
+                    stack.append((value, new_path))
 
-                recursive_get_paths(value, new_path)
+        cls._gui_config_maps = gui_config_maps
+        cls._widget_paths = paths
 
-        initial_path = []
-        recursive_get_paths(self.gui_config_maps, initial_path)
-        self.widget_paths = paths
+    def setup_widget_paths(self):
+        self.load_gui_config_maps()
+        self.gui_config_maps = self._gui_config_maps
+        self.widget_paths = paths = self._widget_paths
+
+        # Resolve the widgets, and how to get and set their values, once
+        # rather than on every sync with the config.
+        self.yaml_widget_items = []
+        for name, path in paths.items():
+            w = getattr(self.ui, name)
+            getter, setter = value_accessors(w)
+            self.yaml_widget_items.append((w, path, getter, setter))
 
-    @property
-    def seed_search_method_parameter_widgets(self):
         maps = self.gui_config_maps
         methods = maps['find_orientations']['seed_search']['method']
         names = [v for d in methods.values() for v in d.values()]
-        return [getattr(self.ui, x) for x in names]
+        self.seed_search_method_parameter_widgets = [
+            getattr(self.ui, x) for x in names
+        ]
 
     @property
     def quaternion_method_name(self):
@@ -356,6 +393,11 @@ class OmeMapsViewerDialog(QObject):
 
         raise Exception(f'Unable to set seed_search_method: {v}')
 
+    def filter_widget_changed(self):
+        # Start or restart the timer. This coalesces rapid changes (such
+        # as holding down a spin box arrow) into a single update.
+        self.filter_timer.start()
+
     def filter_modified(self):
         self.update_enable_states()
         self.update_config()
@@ -420,13 +462,24 @@ class OmeMapsViewerDialog(QObject):
 
     @property
     def hkls(self):
-        return self.data.planeData.getHKLs(*self.data.iHKLList, asStr=True)
+        return self._hkls
+
+    def update_hkls(self):
+        # These only change when the data changes, so compute them once
+        data = self.data
+        self._hkls = data.planeData.getHKLs(*data.iHKLList, asStr=True)
 
     def update_hkl_options(self):
+        w = self.ui.active_hkl
+        hkls = list(self.hkls)
+        if hkls == [w.itemText(i) for i in range(w.count())]:
+            # Nothing changed
+            return
+
         # This won't trigger a re-draw. Can change in the future if needed.
-        with block_signals(self.ui.active_hkl):
-            self.ui.active_hkl.clear()
-            self.ui.active_hkl.addItems(self.hkls)
+        with block_signals(w):
+            w.clear()
+            w.addItems(hkls)
 
     def setup_plot(self):
         # Create the figure and axes to use
@@ -443,6 +496,9 @@ class OmeMapsViewerDialog(QObject):
         ax.format_coord = self.format_coord
         self.ui.canvas_layout.addWidget(canvas)
 
+        # Create the spots artist once, and update its offsets later
+        self._spot_lines = ax.scatter([], [], s=18, c='m', marker='+')
+
         self.toolbar = NavigationToolbar(canvas, self.ui, coordinates=True)
         self.ui.canvas_layout.addWidget(self.toolbar)
 
@@ -495,14 +551,25 @@ class OmeMapsViewerDialog(QObject):
         if hasattr(self, '_data') and d == self._data:
             return
 
-        self.raw_data = copy.deepcopy(d)
+        # Keep a reference to the original data. It is never modified here,
+        # so there is no need to copy it.
+        self.raw_data = d
 
         # This data will have filters applied to it
-        # We will make a shallow copy, and deep copy the data store
+        # We will make a shallow copy, and copy the data store
         # when filters are applied.
         self._data = copy.copy(self.raw_data)
+        self._applied_filter_maps = None
+
+        # Loaded maps keep the data store in a private attribute
+        if hasattr(self._data, '_dataStore'):
+            self._data_store_attr = '_dataStore'
+        else:
+            self._data_store_attr = 'dataStore'
+
         self.reset_filters()
 
+        self.update_hkls()
         self.update_extent()
         self.update_cmap_bounds()
 
@@ -538,28 +605,16 @@ class OmeMapsViewerDialog(QObject):
             self.ui.label_spots.isChecked(),
         ))
 
-    def clear_spot_lines(self):
-        if hasattr(self, '_spot_lines'):
-            self._spot_lines.remove()
-            del self._spot_lines
-
     def update_spots(self):
-        self.clear_spot_lines()
+        spot_lines = self._spot_lines
         if not self.display_spots:
+            spot_lines.set_visible(False)
             self.draw()
             return
 
         self.create_spots()
-        if self.spots.size:
-            kwargs = {
-                'x': self.spots[:, 1],
-                'y': self.spots[:, 0],
-                's': 18,
-                'c': 'm',
-                'marker': '+',
-            }
-            self._spot_lines = self.ax.scatter(**kwargs)
-
+        spot_lines.set_offsets(self.spots)
+        spot_lines.set_visible(True)
         self.draw()
 
     def hkl_index_changed(self):
@@ -620,8 +675,8 @@ class OmeMapsViewerDialog(QObject):
         self.update_plot()
 
     def create_spots(self):
-        # We will clean the data for spot labeling, so make a deep copy
-        data = copy.deepcopy(self.image_data)
+        # We will clean the data for spot labeling, so make a copy
+        data = self.image_data.copy()
         clean_map(data)
 
         method_name = self.seed_search_method_name
@@ -630,16 +685,26 @@ class OmeMapsViewerDialog(QObject):
 
         _, spots = find_peaks_2d(data, method_name, method_kwargs)
 
-        if spots.size:
-            # Rescale the points to match the extents
-            old_extent = self.original_extent
-            old_x_range = (old_extent[0], old_extent[1])
-            old_y_range = (old_extent[3], old_extent[2])
-            new_x_range = (self.extent[0], self.extent[1])
-            new_y_range = (self.extent[3], self.extent[2])
+        if not spots.size:
+            self.spots = np.empty((0, 2))
+            return
+
+        # The peaks are (row, col). Store the spots as (x, y) offsets.
+        spots = spots[:, [1, 0]]
+
+        # Rescale the points to match the extents
+        old_extent = self.original_extent
+        old_x_range = (old_extent[0], old_extent[1])
+        old_y_range = (old_extent[3], old_extent[2])
+        new_x_range = (self.extent[0], self.extent[1])
+        new_y_range = (self.extent[3], self.extent[2])
 
-            spots[:, 1] = np.interp(spots[:, 1], old_x_range, new_x_range)
-            spots[:, 0] = np.interp(spots[:, 0], old_y_range, new_y_range)
+        # The spots are inside the old ranges, so this is just a
+        # linear map from the old range to the new one.
+        for col, old, new in ((0, old_x_range, new_x_range),
+                              (1, old_y_range, new_y_range)):
+            scale = (new[1] - new[0]) / (old[1] - old[0])
+            spots[:, col] = (spots[:, col] - old[0]) * scale + new[0]
 
         self.spots = spots
 
@@ -686,7 +751,7 @@ class OmeMapsViewerDialog(QObject):
 
     @property
     def yaml_widgets(self):
-        return [getattr(self.ui, x) for x in self.widget_paths.keys()]
+        return [x[0] for x in self.yaml_widget_items]
 
     @property
     def all_widgets(self):
@@ -703,29 +768,13 @@ class OmeMapsViewerDialog(QObject):
         self.update_hkl_options()
 
         with block_signals(*self.all_widgets):
-
-            def setter(w):
-                if isinstance(w, QComboBox):
-                    return lambda x: w.setCurrentIndex(w.findData(x))
-
-                # Assume it is a spin box of some kind
-                return w.setValue
-
             config = self.config
 
-            def set_val(w, path):
-                cur = config
-                for x in path:
-                    if x not in cur:
-                        # If it's not in the config, skip over it
-                        return
-                    cur = cur[x]
-
-                setter(w)(cur)
-
-            for w, path in self.widget_paths.items():
-                w = getattr(self.ui, w)
-                set_val(w, path)
+            for _, path, _, setter in self.yaml_widget_items:
+                parent = config_parent(config, path)
+                # If it's not in the config, skip over it
+                if parent is not None and path[-1] in parent:
+                    setter(parent[path[-1]])
 
             find_orientations = config['find_orientations']
 
@@ -779,29 +828,13 @@ class OmeMapsViewerDialog(QObject):
         method_name = self.seed_search_method_name
         dummy_method = (
             self.gui_config_maps['find_orientations']['seed_search']['method'])
-        method[method_name] = copy.deepcopy(dummy_method[method_name])
-
-        def getter(w):
-            if isinstance(w, QComboBox):
-                return w.currentData
-
-            # Assume it is a spin box of some kind
-            return w.value
-
-        def set_val(val, path):
-            cur = config
-            for x in path[:-1]:
-                if x not in cur:
-                    # If it's not in the config, skip over it
-                    return
-                cur = cur[x]
-
-            cur[path[-1]] = val
+        method[method_name] = copy_config(dummy_method[method_name])
 
-        for w, path in self.widget_paths.items():
-            w = getattr(self.ui, w)
-            val = getter(w)()
-            set_val(val, path)
+        for _, path, getter, _ in self.yaml_widget_items:
+            parent = config_parent(config, path)
+            # If it's not in the config, skip over it
+            if parent is not None:
+                parent[path[-1]] = getter()
 
         # Also set the threshold to the minimum color map value...
         find_orientations['threshold'] = self.threshold
@@ -814,28 +847,24 @@ class OmeMapsViewerDialog(QObject):
         config['working_dir'] = self.working_dir
 
     def save_config(self):
-        HexrdConfig().config['indexing'] = copy.deepcopy(self.config)
+        HexrdConfig().config['indexing'] = copy_config(self.config)
 
     def reset_filters(self):
-        # Reset the data store
-        if hasattr(self.data, '_dataStore'):
-            name = '_dataStore'
-        else:
-            name = 'dataStore'
-        setattr(self.data, name, copy.deepcopy(self.raw_data.dataStore))
+        # Include the type, since False == 0.0 and True == 1.0
+        filter_maps = self.filter_maps
+        filter_key = (type(filter_maps), filter_maps)
+        if filter_key == self._applied_filter_maps:
+            # The current data store already has this filter applied
+            return
 
-        # Make a fake config to pass to hexrd
-        class Cfg:
-            pass
+        self._applied_filter_maps = filter_key
 
-        path = ['find_orientations', 'orientation_maps', 'filter_maps']
-        cfg = Cfg()
-        cur = cfg
-        for name in path[:-1]:
-            setattr(cur, name, Cfg())
-            cur = getattr(cur, name)
+        # Reset the data store
+        setattr(self.data, self._data_store_attr,
+                np.array(self.raw_data.dataStore))
 
-        setattr(cur, path[-1], self.filter_maps)
+        cfg = self._filter_cfg
+        cfg.find_orientations.orientation_maps.filter_maps = filter_maps
 
         # Perform the filtering
         filter_maps_if_requested(self.data, cfg)
@@ -853,5 +882,26 @@ class OmeMapsViewerDialog(QObject):
         self.hand_picked_fibers_widget.draw_selected()
 
 
+def value_accessors(w):
+    # Returns a (getter, setter) pair for the value of a config widget
+    if isinstance(w, QComboBox):
+        return w.currentData, lambda x: w.setCurrentIndex(w.findData(x))
+
+    # Assume it is a spin box of some kind
+    return w.value, w.setValue
+
+
+def config_parent(config, path):
+    # Returns the dict containing the last key of the path, or None if
+    # the path is not in the config.
+    cur = config
+    for x in path[:-1]:
+        if x not in cur:
+            return None
+        cur = cur[x]
+
+    return cur
+
+
 class ValidationException(Exception):
     pass
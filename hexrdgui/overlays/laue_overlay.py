@@ -434,17 +434,21 @@ class LaueOverlay(Overlay):
         if display_mode not in (ViewType.raw, ViewType.cartesian):
             raise Exception(f'Unknown view type: {display_mode}')
 
+        if not results:
+            return results
+
+        # Convert all of the ellipses in one call, and split them afterward
+        lengths = [len(x) for x in results]
+        data = np.vstack(results)
         with switch_xray_source(self.instrument, self.xray_source):
-            for result in results:
-                # Convert to Cartesian
-                result[:] = panel.angles_to_cart(result, tvec_c=self.tvec_c)
+            # Convert to Cartesian
+            data = panel.angles_to_cart(data, tvec_c=self.tvec_c)
 
-                if display_mode == ViewType.raw:
-                    # If raw, convert to pixels
-                    result[:] = panel.cartToPixel(result)
-                    result[:, [0, 1]] = result[:, [1, 0]]
+            if display_mode == ViewType.raw:
+                # If raw, convert to pixels
+                data = panel.cartToPixel(data)[:, [1, 0]]
 
-        return results
+        return np.split(data, np.cumsum(lengths)[:-1])
 
     @property
     def default_style(self):
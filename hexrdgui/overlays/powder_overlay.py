@@ -1,5 +1,7 @@
 import copy
+import functools
 
+from numba import njit
 import numpy as np
 
 from hexrd import constants
@@ -49,6 +51,11 @@ class PowderOverlay(Overlay, PolarDistortionObject):
         # Store hkl means if we are in the polar view (for azimuthal lineout)
         self.hkl_means = {}
 
+        # Cartesian ring points for each panel, along with the key they
+        # were computed for. This lets us skip the conversion for panels
+        # that did not change.
+        self._ring_cache = {}
+
     @property
     def child_attributes_to_save(self):
         # These names must be identical here, as attributes, and as
@@ -119,6 +126,18 @@ class PowderOverlay(Overlay, PolarDistortionObject):
     def eta_steps(self, x):
         assert isinstance(x, int), 'input must be an int'
         self._eta_steps = x
+        self._etas = None
+
+    @property
+    def etas(self):
+        # The eta values (in radians) to generate ring points for
+        if self._etas is None:
+            etas = np.linspace(-np.pi, np.pi, num=self.eta_steps + 1)
+            # This is shared between calls, so make sure it isn't modified
+            etas.flags.writeable = False
+            self._etas = etas
+
+        return self._etas
 
     @property
     def delta_eta(self):
@@ -154,21 +173,22 @@ class PowderOverlay(Overlay, PolarDistortionObject):
 
     @property
     def refinement_indices(self):
-        if self.material is None:
-            return np.asarray(range(6))
-        ltype = self.material.unitcell.latticeType
-        return np.asarray(unitcell._rqpDict[ltype][0])
+        material = self.material
+        if material is None:
+            return ALL_REFINEMENT_INDICES
+        return _lattice_refinement_indices(material.unitcell.latticeType)
 
     @property
     def all_refinement_labels(self):
-        return np.asarray(['a', 'b', 'c', 'α', 'β', 'γ'])
+        return ALL_REFINEMENT_LABELS
 
     @property
     def refinement_labels(self):
-        if self.material is None:
+        material = self.material
+        if material is None:
             return self.all_refinement_labels
 
-        return self.all_refinement_labels[self.refinement_indices]
+        return _lattice_refinement_labels(material.unitcell.latticeType)
 
     @property
     def default_refinements(self):
@@ -241,49 +261,61 @@ class PowderOverlay(Overlay, PolarDistortionObject):
 
         tths = plane_data.getTTh()
         hkls = plane_data.getHKLs()
-        etas = np.radians(
-            np.linspace(
-                -180., 180., num=self.eta_steps + 1
-            )
-        )
+        etas = self.etas
 
         if tths.size == 0:
             # No overlays
             return {}
 
-        if plane_data.tThWidth is not None:
+        has_widths = plane_data.tThWidth is not None
+        if has_widths:
             # Need to get width data as well
             indices, ranges = plane_data.getMergedRanges()
             r_lower = [r[0] for r in ranges]
             r_upper = [r[1] for r in ranges]
 
+            # Generate the rings and both sets of ranges together
+            all_tths = np.concatenate([tths, r_lower, r_upper])
+            num_ranges = len(ranges)
+        else:
+            all_tths = tths
+            num_ranges = 0
+
+        # The boundaries between the rings, lower, and upper ranges
+        splits = [len(tths), len(tths) + num_ranges]
+
+        # Drop cached ring points for panels that were removed
+        for name in list(self._ring_cache):
+            if name not in instr.detectors:
+                del self._ring_cache[name]
+
         point_groups = {}
         for det_key, panel in instr.detectors.items():
             keys = ['rings', 'rbnds', 'rbnd_indices', 'hkls']
             point_groups[det_key] = {key: [] for key in keys}
-            ring_pts, skipped_tth = self.generate_ring_points(
-                instr, tths, etas, panel, display_mode)
+            all_pts, all_kept = self.generate_ring_points(
+                instr, all_tths, etas, panel, display_mode)
+
+            # Only kept rings have points, so split those by kept counts
+            kept_tth, lower_kept, upper_kept = np.split(all_kept, splits)
+            pt_splits = np.cumsum([kept_tth.sum(), lower_kept.sum()])
+            ring_pts = all_pts[:pt_splits[0]]
 
-            det_hkls = [x for i, x in enumerate(hkls) if i not in skipped_tth]
+            det_hkls = [hkls[i] for i in np.flatnonzero(kept_tth)]
 
             point_groups[det_key]['rings'] = ring_pts
             point_groups[det_key]['hkls'] = det_hkls
 
-            if plane_data.tThWidth is not None:
-                # Generate the ranges too
-                lower_pts, lower_skipped = self.generate_ring_points(
-                    instr, r_lower, etas, panel, display_mode
-                )
-                upper_pts, upper_skipped = self.generate_ring_points(
-                    instr, r_upper, etas, panel, display_mode
-                )
+            if has_widths:
+                lower_pts = all_pts[pt_splits[0]:pt_splits[1]]
+                upper_pts = all_pts[pt_splits[1]:]
 
                 # The indexing here is to the original HKL list, *not*
                 # the truncated HKL list.
-                lower_indices = [x for i, x in enumerate(indices)
-                                 if i not in lower_skipped]
-                upper_indices = [x for i, x in enumerate(indices)
-                                 if i not in upper_skipped]
+                lower_indices = [indices[i]
+                                 for i in np.flatnonzero(lower_kept)]
+                upper_indices = [indices[i]
+                                 for i in np.flatnonzero(upper_kept)]
 
                 point_groups[det_key]['rbnds'] += lower_pts
                 point_groups[det_key]['rbnd_indices'] += lower_indices
@@ -377,7 +409,9 @@ class PowderOverlay(Overlay, PolarDistortionObject):
         from hexrdgui.hexrd_config import HexrdConfig
 
         ring_pts = []
-        skipped_tth = []
+
+        # Which tth values produced ring points
+        kept_tth = np.ones(len(tths), dtype=bool)
 
         # Grab the distortion object if we have one
         sd = None
@@ -419,36 +453,86 @@ class PowderOverlay(Overlay, PolarDistortionObject):
             first_eta_col = eta_centers[:, 0]
             first_tth_row = tth_centers[0]
 
-        for i, tth in enumerate(tths):
-            # construct ideal angular coords
-            ang_crds_full = np.vstack([np.tile(tth, len(etas)), etas]).T
+        # These are the same for every ring, so compute them once
+        has_pinhole_distortion = (
+            self.pinhole_distortion_type is not None and
+            display_mode in (ViewType.polar, ViewType.stereo)
+        )
+
+        # Figure out whether we are in polar mode with a different XRS.
+        polar_with_different_xrs = (
+            display_mode == ViewType.polar and
+            self.xray_source is not None and
+            self.xray_source != self.active_beam_name
+        )
 
+        def to_cart(ang_crds):
             # Convert nominal powder angle coords to cartesian
             # !!! Tricky business; here we must consider _both_ the SAMPLE
             #     CS origin and anything specified for the XRD COM for the
             #     overlay.  This is so they get properly mapped back to the
             #     the proper cartesian coords.
             with switch_xray_source(self.instrument, self.xray_source):
-                xys_full = panel.angles_to_cart(
-                    ang_crds_full,
+                return panel.angles_to_cart(
+                    ang_crds,
                     tvec_s=instr.tvec,
                     tvec_c=self.tvec
                 )
 
-            # skip if ring not on panel
-            if len(xys_full) == 0:
-                skipped_tth.append(i)
-                continue
+        # construct ideal angular coords for all rings at once
+        n_etas = len(etas)
+        ang_crds_all = np.empty((len(tths) * n_etas, 2))
+        ang_crds_all[:, 0] = np.repeat(tths, n_etas)
+        ang_crds_all[:, 1] = np.tile(etas, len(tths))
 
-            # clip to detector panel
-            xys, on_panel = panel.clip_to_panel(
-                xys_full, buffer_edges=self.clip_with_panel_buffer
+        # The cartesian points only depend on the angles, the translation
+        # vectors, and the panel (with the overlay's x-ray source active).
+        with switch_xray_source(self.instrument, self.xray_source):
+            cache_key = (
+                np.asarray(tths, float).tobytes(),
+                etas.tobytes(),
+                np.asarray(instr.tvec, float).tobytes(),
+                self.tvec.tobytes(),
+                self.clip_with_panel_buffer,
+                _panel_cache_key(panel, self.clip_with_panel_buffer),
             )
 
-            has_pinhole_distortion = (
-                self.pinhole_distortion_type is not None and
-                display_mode in (ViewType.polar, ViewType.stereo)
-            )
+        cached = self._ring_cache.get(panel.name)
+        if cached is not None and cached[0] == cache_key:
+            xys_all, on_panel_all = cached[1]
+        else:
+            # Convert and clip all of the rings in one call each
+            xys_all = to_cart(ang_crds_all)
+            on_panel_all = None
+            if len(xys_all) == len(ang_crds_all):
+                _, on_panel_all = panel.clip_to_panel(
+                    xys_all, buffer_edges=self.clip_with_panel_buffer
+                )
+
+            # Replace any stale entry for this panel
+            self._ring_cache[panel.name] = (cache_key, (xys_all, on_panel_all))
+
+        # This can only be batched if the panel keeps one output point
+        # per input point.
+        batched = on_panel_all is not None
+
+        for i, tth in enumerate(tths):
+            ring_slice = slice(i * n_etas, (i + 1) * n_etas)
+            if batched:
+                on_panel = on_panel_all[ring_slice]
+                xys = xys_all[ring_slice][on_panel]
+            else:
+                xys_full = to_cart(ang_crds_all[ring_slice])
+
+                # skip if ring not on panel
+                if len(xys_full) == 0:
+                    kept_tth[i] = False
+                    continue
+
+                # clip to detector panel
+                xys, on_panel = panel.clip_to_panel(
+                    xys_full, buffer_edges=self.clip_with_panel_buffer
+                )
 
             if has_pinhole_distortion or (
                 (polar_distortion_with_self or offset_distortion) and
@@ -503,9 +587,9 @@ class PowderOverlay(Overlay, PolarDistortionObject):
 
                 # Compute and apply offset
                 for ic, ang_crd in enumerate(raw_ang_crds):
-                    i = np.argmin(np.abs(ang_crd[0] - first_tth_row))
-                    j = np.argmin(np.abs(ang_crd[1] - first_eta_col))
-                    ang_crds[ic, 0] += polar_field[j, i]
+                    ti = np.argmin(np.abs(ang_crd[0] - first_tth_row))
+                    ej = np.argmin(np.abs(ang_crd[1] - first_eta_col))
+                    ang_crds[ic, 0] += polar_field[ej, ti]
 
             if apply_distortion or offset_distortion:
                 if display_mode in (ViewType.raw, ViewType.cartesian):
@@ -524,7 +608,7 @@ class PowderOverlay(Overlay, PolarDistortionObject):
                     )
 
                 if len(ang_crds) == 0:
-                    skipped_tth.append(i)
+                    kept_tth[i] = False
                     continue
 
                 # Convert to degrees
@@ -535,13 +619,6 @@ class PowderOverlay(Overlay, PolarDistortionObject):
                     ang_crds[:, 1], self.eta_period, units='degrees'
                 )
 
-                # Figure out whether we are in polar mode with a different
-                # XRS.
-                polar_with_different_xrs = (
-                    display_mode == ViewType.polar and
-                    self.xray_source is not None and
-                    self.xray_source != self.active_beam_name
-                )
                 if not polar_with_different_xrs:
                     # sort points for monotonic eta
                     # This really messes up the overlays generated for
@@ -550,23 +627,19 @@ class PowderOverlay(Overlay, PolarDistortionObject):
                     eidx = np.argsort(ang_crds[:, 1])
                     ang_crds = ang_crds[eidx, :]
 
-                diff = np.diff(ang_crds[:, 1])
-                if len(diff) == 0:
-                    skipped_tth.append(i)
+                if len(ang_crds) < 2:
+                    kept_tth[i] = False
                     continue
 
-                # Some detectors, such as cylindrical, can easily end up
-                # with points that are connected far apart, and run across
-                # other detectors. Thus, we should insert nans at any gaps.
-                # FIXME: is this a reasonable tolerance?
-                delta_eta_est = np.nanmedian(np.abs(diff))
-                tolerance = delta_eta_est * 2
-                gaps, = np.nonzero(np.abs(diff) > tolerance)
-                ang_crds = np.insert(ang_crds, gaps + 1, np.nan, axis=0)
-
                 if display_mode == ViewType.polar:
+                    # Some detectors, such as cylindrical, can easily end up
+                    # with points that are connected far apart, and run
+                    # across other detectors. Thus, we should insert nans at
+                    # any gaps.
+                    breaks = find_eta_gaps(ang_crds[:, 1])
+
                     # append to list with nan padding
-                    ring_pts.append(np.vstack([ang_crds, nans_row]))
+                    ring_pts.append(insert_nan_rows(ang_crds, breaks))
                 elif display_mode == ViewType.stereo:
                     with switch_xray_source(self.instrument, self.xray_source):
                         # The ang_crds need to be recomputed for the
@@ -583,7 +656,7 @@ class PowderOverlay(Overlay, PolarDistortionObject):
                         )
 
                     # append to list with nan padding
-                    ring_pts.append(np.vstack([stereo_ij, nans_row]))
+                    ring_pts.append(insert_nan_rows(stereo_ij))
 
             elif display_mode in [ViewType.raw, ViewType.cartesian]:
 
@@ -595,28 +668,15 @@ class PowderOverlay(Overlay, PolarDistortionObject):
                     # Convert to pixel coordinates and swap columns
                     xys = panel.cartToPixel(xys)[:, [1, 0]]
 
-                diff_tol = np.radians(self.delta_eta) + 1e-4
-                ring_breaks = np.where(
-                    np.abs(np.diff(etas[on_panel])) > diff_tol
-                )[0] + 1
-                n_segments = len(ring_breaks) + 1
+                # The etas are evenly spaced, so the ring breaks wherever
+                # a sample between two on-panel samples was clipped.
+                on_panel_idx = np.flatnonzero(on_panel)
+                ring_breaks = np.flatnonzero(np.diff(on_panel_idx) > 1) + 1
 
-                if n_segments == 1:
-                    ring_pts.append(np.vstack([xys, nans_row]))
-                else:
-                    src_len = sum(on_panel)
-                    dst_len = src_len + len(ring_breaks)
-                    nxys = np.nan*np.ones((dst_len, 2))
-                    ii = 0
-                    for i in range(n_segments - 1):
-                        jj = ring_breaks[i]
-                        nxys[ii + i:jj + i, :] = xys[ii:jj, :]
-                        ii = jj
-                    i = n_segments - 1
-                    nxys[ii + i:, :] = xys[ii:, :]
-                    ring_pts.append(np.vstack([nxys, nans_row]))
-
-        return ring_pts, skipped_tth
+                # Insert nans at the ring breaks, and append nan padding
+                ring_pts.append(insert_nan_rows(xys, ring_breaks))
+
+        return ring_pts, kept_tth
 
     # START PolarDistortionObject mixin reroutes
     @property
@@ -690,5 +750,77 @@ class PowderOverlay(Overlay, PolarDistortionObject):
         }
 
 
+@njit(cache=True, nogil=True)
+def find_eta_gaps(etas):
+    # Returns the indices after which there is a gap in the etas that is
+    # larger than twice the median spacing.
+    # FIXME: is this a reasonable tolerance?
+    n = len(etas) - 1
+    diffs = np.empty(n)
+    for i in range(n):
+        diffs[i] = abs(etas[i + 1] - etas[i])
+
+    tolerance = np.nanmedian(diffs) * 2
+    return np.nonzero(diffs > tolerance)[0] + 1
+
+
+@functools.cache
+def _lattice_refinement_indices(ltype):
+    # The lattice parameter indices that can be refined for a lattice type.
+    # This is shared, so make sure it isn't modified.
+    indices = np.asarray(unitcell._rqpDict[ltype][0])
+    indices.flags.writeable = False
+    return indices
+
+
+@functools.cache
+def _lattice_refinement_labels(ltype):
+    labels = ALL_REFINEMENT_LABELS[_lattice_refinement_indices(ltype)]
+    labels.flags.writeable = False
+    return labels
+
+
+def insert_nan_rows(points, breaks=()):
+    # Insert a nan row before each of the breaks, and one at the end as
+    # padding. This makes a single copy of the points.
+    breaks = np.append(breaks, len(points)).astype(int)
+    return np.insert(points, breaks, np.nan, axis=0)
+
+
+def _panel_cache_key(panel, include_buffer):
+    # Everything about the panel that affects its cartesian ring points
+    distortion = panel.distortion
+    if distortion is not None:
+        params = getattr(distortion, 'params', None)
+        distortion = (
+            type(distortion).__name__,
+            np.asarray(params, dtype=float).tobytes(),
+        )
+
+    panel_buffer = None
+    if include_buffer and panel.panel_buffer is not None:
+        panel_buffer = np.asarray(panel.panel_buffer).tobytes()
+
+    return (
+        type(panel).__name__,
+        panel.name,
+        panel.rows,
+        panel.cols,
+        panel.pixel_size_row,
+        panel.pixel_size_col,
+        np.asarray(panel.rmat, float).tobytes(),
+        np.asarray(panel.tvec, float).tobytes(),
+        np.asarray(panel.bvec, float).tobytes(),
+        np.asarray(panel.evec, float).tobytes(),
+        getattr(panel, 'radius', None),
+        distortion,
+        panel_buffer,
+    )
+
+
 # Constants
-nans_row = np.nan * np.ones((1, 2))
+# These are shared, so make sure they aren't modified
+ALL_REFINEMENT_INDICES = np.arange(6)
+ALL_REFINEMENT_INDICES.flags.writeable = False
+ALL_REFINEMENT_LABELS = np.asarray(['a', 'b', 'c', 'α', 'β', 'γ'])
+ALL_REFINEMENT_LABELS.flags.writeable = False
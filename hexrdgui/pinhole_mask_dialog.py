@@ -46,8 +46,9 @@ class PinholeMaskDialog(QObject):
             HexrdConfig().physics_package.pinhole_thickness)
 
     def save_settings(self):
-        for name in self.settings:
-            self.settings[name] = getattr(self, name)
+        settings = self.settings
+        for name in settings:
+            settings[name] = getattr(self, name)
 
     @property
     def pinhole_diameter(self):
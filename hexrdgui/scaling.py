@@ -27,9 +27,22 @@ def log_log_sqrt(x):
 # the same range as the transform input.
 def rescale_to_original(func):
     def rescale_to_old(new, old):
-        new_range = (np.nanmin(new), np.nanmax(new))
-        old_range = (np.nanmin(old), np.nanmax(old))
-        return np.interp(new, new_range, old_range)
+        new_min, new_max = np.nanmin(new), np.nanmax(new)
+        old_min, old_max = np.nanmin(old), np.nanmax(old)
+
+        # `new` is a temporary made by the transform, so we can modify
+        # it in place. This is the same as np.interp() with two points,
+        # but avoids its search overhead on large images.
+        new = np.asarray(new, dtype=np.float64)
+        if new_max == new_min:
+            # np.interp() maps everything to the upper bound in this case
+            new[~np.isnan(new)] = old_max
+            return new
+
+        new -= new_min
+        new *= (old_max - old_min) / (new_max - new_min)
+        new += old_min
+        return new
 
     @functools.wraps(func)
     def wrapper(old):
@@ -277,6 +277,31 @@ def has_nan(x):
     return np.isnan(np.min(x))
 
 
+def copy_config(config):
+    """Deep copy a config made of dicts, lists, and plain values
+
+    This is much faster than copy.deepcopy() on config trees. Numpy arrays
+    are copied via their copy() method, and any other objects that are not
+    known to be immutable fall back to copy.deepcopy().
+    """
+    config_type = type(config)
+    if config_type is dict:
+        return {k: copy_config(v) for k, v in config.items()}
+    elif config_type is list:
+        return [copy_config(v) for v in config]
+    elif config_type is tuple:
+        return tuple(copy_config(v) for v in config)
+    elif config_type is np.ndarray:
+        return config.copy()
+    elif config is None or config_type in _IMMUTABLE_CONFIG_TYPES:
+        return config
+
+    return copy.deepcopy(config)
+
+
+_IMMUTABLE_CONFIG_TYPES = (bool, int, float, str)
+
+
 def instr_to_internal_dict(instr, calibration_dict=None, convert_tilts=True):
     from hexrdgui.hexrd_config import HexrdConfig
 
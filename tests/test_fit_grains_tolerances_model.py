@@ -0,0 +1,96 @@
+import pytest
+
+from hexrdgui.indexing.fit_grains_tolerances_model import (
+    FitGrainsToleranceModel
+)
+
+
+def example_config():
+    return {
+        'tth': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        'eta': [1.1, 1.2, 1.3, 1.4, 1.5, 1.6],
+        'omega': [2.1, 2.2, 2.3, 2.4, 2.5, 2.6],
+    }
+
+
+def old_move_rows(columns, rows, delta):
+    # The list-based code that move_rows() replaced
+    first = rows[0]
+    last = rows[-1]
+    destination = first + delta
+    for data in columns:
+        moving_section = data[first:last+1]
+        remaining_list = data[:first] + data[last+1:]
+        first_section = remaining_list[:destination]
+        last_section = remaining_list[destination:]
+        data[:] = first_section + moving_section + last_section
+
+
+def old_delete_rows(columns, rows):
+    # The list-based code that delete_rows() replaced
+    first = rows[0]
+    last = rows[-1]
+    for data in columns:
+        for row in range(last, first-1, -1):
+            del data[row]
+
+
+def make_model():
+    model = FitGrainsToleranceModel()
+    model.update_from_config(example_config())
+    return model
+
+
+@pytest.mark.parametrize('moves', [
+    [([0], 1)],
+    [([5], -1)],
+    [([1, 2], 2)],
+    [([1, 2, 3], 2)],
+    [([3, 4, 5], -3)],
+    [([2, 3], -1)],
+    [([0, 1], 1), ([2, 3], -2), ([4, 5], -1), ([0, 1, 2], 3)],
+])
+def test_move_rows(moves):
+    model = make_model()
+    expected = list(example_config().values())
+
+    for rows, delta in moves:
+        model.move_rows(rows, delta)
+        old_move_rows(expected, rows, delta)
+
+        assert list(model.data_columns) == expected
+
+
+@pytest.mark.parametrize('rows', [[0], [5], [1, 2], [2, 3, 4], [0, 1, 2]])
+def test_delete_rows(rows):
+    model = make_model()
+    expected = list(example_config().values())
+
+    model.delete_rows(rows)
+    old_delete_rows(expected, rows)
+
+    assert list(model.data_columns) == expected
+    assert model.rowCount() == len(expected[0])
+
+
+def test_copy_to_config():
+    model = make_model()
+    model.add_row()
+
+    config = {}
+    model.copy_to_config(config)
+
+    expected = example_config()
+    for v in expected.values():
+        v.append(0.0)
+
+    assert config['tolerance'] == expected
+
+
+def test_mismatched_lengths():
+    config = example_config()
+    config['eta'].pop()
+
+    model = FitGrainsToleranceModel()
+    with pytest.raises(Exception, match='same length'):
+        model.update_from_config(config)
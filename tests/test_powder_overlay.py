@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from hexrdgui.overlays.powder_overlay import find_eta_gaps, insert_nan_rows
+
+
+def old_insert_nan_rows(points, breaks=()):
+    # The list-based code that insert_nan_rows() replaced
+    if len(breaks) > 0:
+        points = np.insert(points, breaks, np.nan, axis=0)
+
+    nans_row = np.nan * np.ones((1, points.shape[1]))
+    return np.vstack([points, nans_row])
+
+
+def old_find_eta_gaps(etas):
+    # The numpy code that find_eta_gaps() replaced
+    diff = np.diff(etas)
+    tolerance = np.nanmedian(np.abs(diff)) * 2
+    gaps, = np.nonzero(np.abs(diff) > tolerance)
+    return gaps + 1
+
+
+@pytest.mark.parametrize('breaks', [
+    [],
+    np.array([], dtype=int),
+    [3],
+    [0, 4],
+    np.array([1, 2, 7]),
+    [8],
+])
+def test_insert_nan_rows(breaks):
+    points = np.arange(16, dtype=np.float64).reshape(8, 2)
+
+    expected = old_insert_nan_rows(points, breaks)
+    result = insert_nan_rows(points, breaks)
+
+    assert result.shape == expected.shape
+    np.testing.assert_array_equal(result, expected)
+
+    # The points should not have been modified
+    np.testing.assert_array_equal(points, np.arange(16).reshape(8, 2))
+
+
+def test_insert_nan_rows_default_breaks():
+    points = np.ones((5, 2))
+    np.testing.assert_array_equal(insert_nan_rows(points),
+                                  old_insert_nan_rows(points))
+
+
+@pytest.mark.parametrize('etas', [
+    np.linspace(-np.pi, np.pi, 360),
+    np.concatenate((np.linspace(-3, -1, 50), np.linspace(1, 3, 50))),
+    np.concatenate((
+        np.linspace(-3, -2, 20),
+        np.linspace(-1, 0, 20),
+        np.linspace(2, 3, 20),
+    )),
+    np.array([0.0, 0.1]),
+])
+def test_find_eta_gaps(etas):
+    np.testing.assert_array_equal(find_eta_gaps(etas),
+                                  old_find_eta_gaps(etas))
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from hexrdgui import scaling
+
+
+def old_rescale_to_original(func, old):
+    # The np.interp() based rescaling that rescale_to_original() replaced
+    new = func(old)
+    new_range = (np.nanmin(new), np.nanmax(new))
+    old_range = (np.nanmin(old), np.nanmax(old))
+    return np.interp(new, new_range, old_range)
+
+
+def example_images():
+    rng = np.random.default_rng(0)
+
+    random_img = rng.uniform(-50, 1000, (64, 48))
+
+    nan_img = random_img.copy()
+    nan_img[3, :10] = np.nan
+
+    int_img = rng.integers(0, 1000, (32, 32), dtype=np.int32)
+
+    constant_img = np.full((16, 16), 7.5)
+
+    return [random_img, nan_img, int_img, constant_img]
+
+
+@pytest.mark.parametrize('name', ['sqrt', 'log', 'log-log-sqrt'])
+def test_rescale_to_original_matches_interp(name):
+    func = getattr(scaling, name.replace('-', '_'))
+    rescaled_func = scaling.SCALING_OPTIONS[name]
+
+    for img in example_images():
+        expected = old_rescale_to_original(func, img)
+        result = rescaled_func(img)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-9)
+
+    # The input should not have been modified
+    img = example_images()[0]
+    original = img.copy()
+    rescaled_func(img)
+    np.testing.assert_array_equal(img, original)
@@ -0,0 +1,71 @@
+import copy
+
+import numpy as np
+
+from hexrdgui.utils import copy_config
+
+
+def example_config():
+    return {
+        'analysis_name': 'ruby',
+        'multiprocessing': -1,
+        'find_orientations': {
+            'orientation_maps': {
+                'active_hkls': [0, 1, 2],
+                'threshold': 25.0,
+                'bin_frames': 1,
+                'file': None,
+            },
+            'seed_search': {
+                'hkl_seeds': [0, 1],
+                'fiber_step': 0.5,
+                'method': {'label': {'filter_radius': 1}},
+            },
+            'use_quaternion_grid': False,
+            'omega': {
+                'period': (-180.0, 180.0),
+                'tolerance': 1.0,
+            },
+        },
+        'fit_grains': {
+            'tolerance': {
+                'tth': [0.25, 0.2],
+                'eta': [3.0, 2.0],
+                'omega': [2.0, 1.0],
+            },
+            'refit': [1, 1],
+        },
+        'eta_ranges': np.array([[-np.pi, np.pi]]),
+        'nested': [[1, [2.5, 'a']], ({'b': True},)],
+    }
+
+
+def test_copy_config_matches_deepcopy():
+    config = example_config()
+
+    copied = copy_config(config)
+    expected = copy.deepcopy(config)
+
+    np.testing.assert_equal(copied, expected)
+
+    # The container types should be preserved
+    omega = copied['find_orientations']['omega']
+    assert isinstance(omega['period'], tuple)
+    assert isinstance(copied['nested'][1], tuple)
+    assert isinstance(copied['eta_ranges'], np.ndarray)
+
+
+def test_copy_config_is_deep():
+    config = example_config()
+    copied = copy_config(config)
+
+    # Modify every mutable container in the copy
+    copied['find_orientations']['orientation_maps']['active_hkls'].append(3)
+    copied['find_orientations']['seed_search']['method']['label'].clear()
+    copied['fit_grains']['tolerance']['tth'][0] = 1.0
+    copied['eta_ranges'][0, 0] = 0
+    copied['nested'][0][1][0] = 5
+    copied['nested'][1][0]['b'] = False
+
+    # The original should not have changed
+    np.testing.assert_equal(config, example_config())